@@ -100,11 +100,12 @@ def jouer_un_coup(id_partie, origine, direction, idul, secret):
         raise ConnectionError(f"Erreur lors de la connexion: {e}") from e
 
 
-def récupérer_une_partie(id_partie, secret):
+def récupérer_une_partie(id_partie, idul, secret):
     """Récupère les informations d'une partie en cours.
 
     Args:
         id_partie (str): L'identifiant de la partie.
+        idul (str): L'identifiant de l'utilisateur.
         secret (str): Le secret pour l'authentification.
 
     Returns:
@@ -112,14 +113,13 @@ def récupérer_une_partie(id_partie, secret):
 
     Raises:
         PermissionError: Si l'authentification échoue (code 401).
+        RuntimeError: Si le serveur ne connaît pas la partie (code 404).
         ConnectionError: Si la connexion échoue.
     """
     url = f"{URL}partie/{id_partie}/"
 
-    headers = {"Authorization": f"Bearer {secret}"}
-
     try:
-        response = requests.get(url, headers=headers)
+        response = requests.get(url, auth=(idul, secret))
 
         if response.status_code == 200:
             data = response.json()
@@ -134,7 +134,10 @@ def récupérer_une_partie(id_partie, secret):
             message = response.json().get("message", "Erreur non spécifiée.")
             raise PermissionError(message)
 
-        raise ConnectionError()
+        if response.status_code == 404:
+            raise RuntimeError(f"La partie {id_partie} est introuvable.")
+
+        raise ConnectionError(f"Erreur de connexion: {response.status_code}")
 
     except requests.exceptions.RequestException as e:
         raise ConnectionError(f"Erreur lors de la connexion: {e}") from e
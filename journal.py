@@ -0,0 +1,197 @@
+"""Module Journal
+
+Classes:
+    * JournalQuixo - Journal local des parties pour reprendre après un arrêt.
+
+Functions:
+    * reprendre_une_partie - Reprend la plus récente partie ouverte du journal.
+"""
+
+import json
+import sqlite3
+from quixo_error import QuixoError
+from session import SessionQuixo
+
+SCHÉMA = """
+CREATE TABLE IF NOT EXISTS parties (
+    id_partie TEXT PRIMARY KEY,
+    joueurs TEXT NOT NULL,
+    plateau TEXT,
+    gagnant TEXT
+);
+CREATE TABLE IF NOT EXISTS coups (
+    numéro INTEGER PRIMARY KEY,
+    id_partie TEXT NOT NULL REFERENCES parties (id_partie),
+    pion TEXT NOT NULL,
+    origine TEXT,
+    direction TEXT,
+    plateau TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coups_par_partie ON coups (id_partie, numéro);
+"""
+
+
+class JournalQuixo:
+    """Journal local des parties pour reprendre après un arrêt.
+
+    Le journal est une base SQLite en mode WAL où l'on ajoute les parties et
+    les coups au fur et à mesure. Les coups d'un même tour (le nôtre et celui
+    de l'adversaire) sont validés ensemble dans une seule transaction (group
+    commit), ce qui suffit à les rendre durables si le processus s'arrête.
+    Avec synchronous=NORMAL, SQLite ne synchronise le disque qu'aux points de
+    contrôle, ce qui garde le coût par coup bien en dessous d'une milliseconde.
+    """
+
+    def __init__(self, chemin):
+        """Constructeur de la classe JournalQuixo
+
+        Args:
+            chemin (str): Le chemin du fichier de journal.
+        """
+        self.connexion = sqlite3.connect(chemin, isolation_level=None)
+        self.connexion.execute("PRAGMA journal_mode=WAL")
+        self.connexion.execute("PRAGMA synchronous=NORMAL")
+        self.connexion.executescript(SCHÉMA)
+
+    def __enter__(self):
+        """Retourne le journal pour l'utiliser dans un bloc with."""
+        return self
+
+    def __exit__(self, *exc):
+        """Ferme le journal."""
+        self.fermer()
+
+    def ouvrir_partie(self, id_partie, joueurs, plateau=None):
+        """Enregistre une nouvelle partie.
+
+        Args:
+            id_partie (str): L'identifiant de la partie.
+            joueurs (list[str]): La liste des deux joueurs.
+            plateau (list[list[str]], optional): Le plateau initial.
+        """
+        self.connexion.execute(
+            "INSERT OR IGNORE INTO parties (id_partie, joueurs, plateau) VALUES (?, ?, ?)",
+            (id_partie, json.dumps(joueurs), json.dumps(plateau)),
+        )
+
+    def enregistrer_coup(self, id_partie, pion, origine, direction, plateau):
+        """Ajoute un coup et le plateau qui en résulte au journal.
+
+        Args:
+            id_partie (str): L'identifiant de la partie.
+            pion (str): Le symbole du pion joué ('X' ou 'O').
+            origine (list[int] or None): La position du cube déplacé, ou None
+                si le coup n'est pas connu.
+            direction (str or None): La direction de l'insertion, ou None.
+            plateau (list[list[str]]): Le plateau après le coup.
+        """
+        self.enregistrer_tour(id_partie, [(pion, origine, direction, plateau)])
+
+    def enregistrer_tour(self, id_partie, coups):
+        """Ajoute les coups d'un tour au journal dans une seule transaction.
+
+        Args:
+            id_partie (str): L'identifiant de la partie.
+            coups (list[tuple]): Les coups du tour, chacun sous la forme
+                (pion, origine, direction, plateau) comme pour enregistrer_coup.
+        """
+        with self.connexion:
+            self.connexion.execute("BEGIN")
+            self.connexion.executemany(
+                "INSERT INTO coups (id_partie, pion, origine, direction, plateau) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (id_partie, pion, json.dumps(origine), direction, json.dumps(plateau))
+                    for pion, origine, direction, plateau in coups
+                ],
+            )
+
+    def terminer_partie(self, id_partie, gagnant):
+        """Marque une partie comme terminée.
+
+        Args:
+            id_partie (str): L'identifiant de la partie.
+            gagnant (str): Le gagnant de la partie.
+        """
+        self.connexion.execute(
+            "UPDATE parties SET gagnant = ? WHERE id_partie = ?",
+            (gagnant, id_partie),
+        )
+
+    def abandonner_partie(self, id_partie):
+        """Ferme une partie que le serveur ne connaît plus, sans gagnant.
+
+        Args:
+            id_partie (str): L'identifiant de la partie.
+        """
+        self.terminer_partie(id_partie, "")
+
+    def parties_ouvertes(self):
+        """Retourne les parties non terminées, de la plus récente à la plus ancienne.
+
+        Returns:
+            list[tuple]: Des tuples contenant l'id de la partie, les joueurs
+            et le dernier plateau enregistré.
+        """
+        rangées = self.connexion.execute(
+            """
+            SELECT p.id_partie, p.joueurs, COALESCE(
+                (SELECT c.plateau FROM coups c WHERE c.id_partie = p.id_partie
+                 ORDER BY c.numéro DESC LIMIT 1),
+                p.plateau
+            )
+            FROM parties p
+            WHERE p.gagnant IS NULL
+            ORDER BY p.rowid DESC
+            """
+        )
+        return [
+            (id_partie, json.loads(joueurs), json.loads(plateau))
+            for id_partie, joueurs, plateau in rangées
+        ]
+
+    def fermer(self):
+        """Ferme la connexion au journal."""
+        self.connexion.close()
+
+
+def reprendre_une_partie(journal, récupérer):
+    """Reprend la plus récente partie ouverte du journal.
+
+    Le serveur n'est consulté que pour confirmer le dernier état de chaque partie.
+    Les parties terminées ou inconnues du serveur sont fermées dans le journal, et
+    celles dont la réponse est invalide sont ignorées.
+
+    Args:
+        journal (JournalQuixo): Le journal des parties.
+        récupérer (callable): Fonction qui reçoit l'id d'une partie et retourne
+            l'id, les joueurs, le plateau et le gagnant, comme récupérer_une_partie.
+
+    Returns:
+        SessionQuixo or None: La session reprise, ou None si aucune partie ne peut
+        être reprise ou si le serveur est injoignable.
+    """
+    for id_partie, joueurs, plateau in journal.parties_ouvertes():
+        try:
+            _, joueurs, plateau_serveur, gagnant = récupérer(id_partie)
+        except ConnectionError:
+            return None
+        except RuntimeError:
+            journal.abandonner_partie(id_partie)
+            continue
+        except (PermissionError, KeyError, TypeError, ValueError):
+            continue
+
+        if gagnant:
+            journal.terminer_partie(id_partie, gagnant)
+            continue
+
+        try:
+            session = SessionQuixo(id_partie, joueurs, plateau)
+            session.synchroniser(joueurs, plateau_serveur)
+        except QuixoError:
+            continue
+
+        return session
+
+    return None
@@ -3,28 +3,73 @@
 Ce programme permet de joueur au jeu Quixo.
 """
 
-from api import initialiser_partie, jouer_un_coup
-from quixo import Quixo, interpréter_la_commande
+from api import initialiser_partie, jouer_un_coup, récupérer_une_partie
+from journal import JournalQuixo, reprendre_une_partie
+from quixo import interpréter_la_commande
+from session import SessionQuixo
 
 # Mettre ici votre secret récupérer depuis le site de PAX
 SECRET = ""
 
+# Fichier du journal local utilisé pour reprendre les parties après un arrêt
+JOURNAL = "journal.sqlite3"
 
-if __name__ == "__main__":
-    args = interpréter_la_commande()
-    id_partie, joueurs, plateau = initialiser_partie(args.idul, SECRET)
+
+def jouer_une_partie(session, journal, idul):
+    """Joue la partie jusqu'à ce que le serveur annonce un gagnant.
+
+    Args:
+        session (SessionQuixo): La session de la partie en cours.
+        journal (JournalQuixo): Le journal où enregistrer les coups.
+        idul (str): L'identifiant de l'utilisateur.
+
+    Returns:
+        str: Le gagnant de la partie.
+    """
     while True:
-        # Créer une instance de Quixo
-        quixo = Quixo(joueurs, plateau)
         # Afficher la partie
-        print(quixo)
+        print(session)
         # Demander au joueur de choisir son prochain coup
-        origine, direction = quixo.choisir_un_coup()
+        origine, direction = session.quixo.choisir_un_coup()
         # Envoyez le coup au serveur
-        id_partie, joueurs, plateau = jouer_un_coup(
-            id_partie,
+        résultat = jouer_un_coup(
+            session.id_partie,
             origine,
             direction,
-            args.idul,
+            idul,
             SECRET,
         )
+        if isinstance(résultat, str):
+            journal.terminer_partie(session.id_partie, résultat)
+            print(f"Le gagnant est {résultat}")
+            return résultat
+        session.id_partie, joueurs, plateau = résultat
+        # Appliquer notre coup puis réconcilier avec le plateau du serveur
+        session.jouer_coup(origine, direction)
+        notre_plateau = session.quixo.plateau.état_plateau()
+        session.synchroniser(joueurs, plateau)
+        # Le coup adverse est inconnu si le plateau a dû être reconstruit
+        origine_adverse, direction_adverse = session.dernier_coup_adverse or (None, None)
+        # Enregistrer les deux coups du tour dans une seule transaction
+        journal.enregistrer_tour(
+            session.id_partie,
+            [
+                (session.pion, origine, direction, notre_plateau),
+                (session.pion_adverse, origine_adverse, direction_adverse, plateau),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    args = interpréter_la_commande()
+    with JournalQuixo(JOURNAL) as journal:
+        session = reprendre_une_partie(
+            journal,
+            lambda id_partie: récupérer_une_partie(id_partie, args.idul, SECRET),
+        )
+        if session is None:
+            id_partie, joueurs, plateau = initialiser_partie(args.idul, SECRET)
+            journal.ouvrir_partie(id_partie, joueurs, plateau)
+            # Créer une seule session pour toute la partie
+            session = SessionQuixo(id_partie, joueurs, plateau)
+        jouer_une_partie(session, journal, args.idul)
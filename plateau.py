@@ -39,6 +39,19 @@ class Plateau:
         """
         return deepcopy(self.plateau)
 
+    def copie(self):
+        """Retourne une copie indépendante du plateau sans le revalider.
+
+        Le plateau courant est déjà valide, donc on évite la copie profonde
+        et la validation faites par le constructeur.
+
+        Returns:
+            Plateau: Un nouveau plateau contenant les mêmes cubes.
+        """
+        copie = Plateau.__new__(Plateau)
+        copie.plateau = [ligne[:] for ligne in self.plateau]
+        return copie
+
     def __str__(self):
         """Retourne une représentation du plateau sous forme de chaîne de caractères."""
         lignes = []
@@ -59,7 +72,8 @@ class Plateau:
         """Récupère la valeur à la position spécifiée sur le plateau.
 
         Args:
-            position (tuple): Coordonnées (x, y) de la position sur le plateau.
+            position (tuple): Coordonnées (x, y) de la position sur le plateau,
+                x étant la colonne et y la ligne.
 
         Returns:
             str: La valeur à la position spécifiée sur le plateau.
@@ -72,13 +86,14 @@ class Plateau:
         if not (1 <= x <= 5 and 1 <= y <= 5):
             raise QuixoError("Les positions x et y doivent être entre 1 et 5 inclusivement.")
 
-        return self.plateau[x - 1][y - 1]
+        return self.plateau[y - 1][x - 1]
 
     def __setitem__(self, position, valeur):
         """Modifie la valeur à la position spécifiée sur le plateau.
 
         Args:
-            position (tuple): Coordonnées (x, y) de la position sur le plateau.
+            position (tuple): Coordonnées (x, y) de la position sur le plateau,
+                x étant la colonne et y la ligne.
             valeur (str): La nouvelle valeur à insérer.
 
         Raises:
@@ -93,7 +108,7 @@ class Plateau:
         if valeur not in ["X", "O", " "]:
             raise QuixoError("Valeur du cube invalide.")
 
-        self.plateau[x - 1][y - 1] = valeur
+        self.plateau[y - 1][x - 1] = valeur
 
     def générer_le_plateau(self, plateau):
         """Génère le plateau en vérifiant la validité de sa structure.
@@ -160,10 +175,10 @@ class Plateau:
         if x < 1 or x > 5 or y < 1 or y > 5:
             raise QuixoError("Les positions x et y doivent être entre 1 et 5 inclusivement.")
 
-        for i in range(4, 0, -1):
-            self[x - 1, i] = self[x - 1, i - 1]
+        for i in range(y, 5):
+            self[x, i] = self[x, i + 1]
 
-        self[x - 1, 0] = cube
+        self[x, 5] = cube
 
     def insérer_par_le_haut(self, cube, origine):
         """Insère un cube dans le plateau en partant du haut.
@@ -179,10 +194,10 @@ class Plateau:
         if x < 1 or x > 5 or y < 1 or y > 5:
             raise QuixoError("Les positions x et y doivent être entre 1 et 5 inclusivement.")
 
-        for i in range(1, 5):
-            self[x - 1, i - 1] = self[x - 1, i]
+        for i in range(y, 1, -1):
+            self[x, i] = self[x, i - 1]
 
-        self[x - 1, 4] = cube
+        self[x, 1] = cube
 
     def insérer_par_la_gauche(self, cube, origine):
         """Insère un cube dans le plateau en partant de la gauche.
@@ -198,10 +213,10 @@ class Plateau:
         if x < 1 or x > 5 or y < 1 or y > 5:
             raise QuixoError("Les positions x et y doivent être entre 1 et 5 inclusivement.")
 
-        for i in range(1, 5):
-            self[i - 1, y - 1] = self[i, y - 1]
+        for i in range(x, 1, -1):
+            self[i, y] = self[i - 1, y]
 
-        self[4, y - 1] = cube
+        self[1, y] = cube
 
     def insérer_par_la_droite(self, cube, origine):
         """Insère un cube dans la colonne spécifiée de droite à gauche dans le plateau de jeu.
@@ -217,7 +232,7 @@ class Plateau:
         if x < 1 or x > 5 or y < 1 or y > 5:
             raise QuixoError("Les positions x et y doivent être entre 1 et 5 inclusivement.")
 
-        for i in range(4, 0, -1):
-            self[i, y - 1] = self[i - 1, y - 1]
+        for i in range(x, 5):
+            self[i, y] = self[i + 1, y]
 
-        self[0, y - 1] = cube
+        self[5, y] = cube
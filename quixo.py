@@ -61,7 +61,7 @@ class Quixo:
         lignes.append("   -------------------")
 
         for i in range(5):
-            ligne = f"{i + 1} | " + " | ".join(self.plateau[i]) + " |"
+            ligne = f"{i + 1} | " + " | ".join(self.plateau.plateau[i]) + " |"
             lignes.append(ligne)
 
             if i < 4:
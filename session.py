@@ -0,0 +1,186 @@
+"""Module Session
+
+Classes:
+    * SessionQuixo - Partie Quixo persistante synchronisée avec le serveur.
+"""
+
+from plateau import Plateau
+from quixo import Quixo
+
+
+class SessionQuixo:
+    """Partie Quixo persistante synchronisée avec le serveur.
+
+    Au lieu de reconstruire une instance de Quixo à chaque tour, la session
+    conserve la même instance. Notre coup est appliqué localement, puis le
+    plateau retourné par le serveur est réconcilié en cherchant le coup adverse
+    qui explique la différence. Le plateau n'est reconstruit et revalidé au
+    complet que si aucun coup n'explique la différence.
+    """
+
+    def __init__(self, id_partie, joueurs, plateau=None, pion="X"):
+        """Constructeur de la classe SessionQuixo
+
+        Args:
+            id_partie (str): L'identifiant de la partie.
+            joueurs (list[str]): La liste des deux joueurs.
+            plateau (list[list[str]], optional): La représentation du plateau
+                tel que retourné par le serveur de jeu ou la valeur None par défaut.
+            pion (str, optional): Le symbole de notre pion, "X" par défaut.
+        """
+        self.id_partie = id_partie
+        self.quixo = Quixo(joueurs, plateau)
+        self.pion = pion
+        self.pion_adverse = "O" if pion == "X" else "X"
+        self.dernier_coup_adverse = None
+
+    def __str__(self):
+        """Retourne la représentation du jeu sous forme de chaîne de caractères."""
+        return str(self.quixo)
+
+    def jouer_coup(self, origine, direction):
+        """Applique localement notre coup sur le plateau.
+
+        Args:
+            origine (list[int]): La position (x, y) du cube à déplacer.
+            direction (str): La direction de l'insertion.
+
+        Raises:
+            QuixoError: Si le coup est invalide.
+        """
+        self.quixo.déplacer_pion(self.pion, origine, direction)
+
+    def synchroniser(self, joueurs, plateau):
+        """Réconcilie l'état local avec l'état retourné par le serveur.
+
+        Args:
+            joueurs (list[str]): La liste des deux joueurs.
+            plateau (list[list[str]]): La représentation du plateau
+                tel que retourné par le serveur de jeu.
+
+        Returns:
+            bool: True si l'état local a été conservé (avec au plus un coup adverse
+            appliqué), False s'il a fallu reconstruire le plateau au complet.
+        """
+        self.quixo.joueurs = joueurs
+        self.dernier_coup_adverse = None
+
+        if self.quixo.plateau.plateau == plateau:
+            return True
+
+        coup = self.trouver_coup_adverse(plateau)
+
+        if coup is None:
+            self.quixo.plateau = Plateau(plateau)
+            return False
+
+        # Le coup reproduit exactement le plateau du serveur sur sa ligne ou sa
+        # colonne, on recopie donc ces cases sans repasser par la validation.
+        (x, y), direction = coup
+        actuel = self.quixo.plateau.plateau
+
+        if direction in ("gauche", "droite"):
+            actuel[y - 1] = plateau[y - 1][:]
+        else:
+            for ligne, ligne_serveur in zip(actuel, plateau):
+                ligne[x - 1] = ligne_serveur[x - 1]
+
+        self.dernier_coup_adverse = coup
+        return True
+
+    def trouver_coup_adverse(self, plateau):
+        """Cherche le coup adverse qui transforme le plateau local en celui donné.
+
+        Un coup ne modifie qu'une ligne ou une colonne. On repère donc la ligne ou
+        la colonne qui contient toutes les différences, puis on ne simule que les
+        coups le long de celle-ci.
+
+        Args:
+            plateau (list[list[str]]): Le plateau cible.
+
+        Returns:
+            tuple or None: Le coup (origine, direction) trouvé ou None si aucun
+            coup adverse n'explique la différence.
+        """
+        actuel = self.quixo.plateau.plateau
+
+        if len(plateau) != 5 or any(len(ligne) != 5 for ligne in plateau):
+            return None
+
+        lignes = [y for y in range(5) if actuel[y] != plateau[y]]
+        colonnes = {
+            x for y in lignes for x in range(5) if actuel[y][x] != plateau[y][x]
+        }
+
+        if len(lignes) == 1:
+            y = lignes[0] + 1
+            coup = self.trouver_coup_sur_la_ligne(
+                [((x, y), x) for x in range(1, 6) if y in (1, 5) or x in (1, 5)],
+                ("gauche", "droite"),
+                actuel[y - 1],
+                plateau[y - 1],
+            )
+
+            if coup is not None:
+                return coup
+
+        if len(colonnes) == 1:
+            x = colonnes.pop() + 1
+            return self.trouver_coup_sur_la_ligne(
+                [((x, y), y) for y in range(1, 6) if x in (1, 5) or y in (1, 5)],
+                ("haut", "bas"),
+                [ligne[x - 1] for ligne in actuel],
+                [ligne[x - 1] for ligne in plateau],
+            )
+
+        return None
+
+    def trouver_coup_sur_la_ligne(self, origines, directions, avant, après):
+        """Cherche le coup adverse qui transforme une ligne ou une colonne.
+
+        Args:
+            origines (list[tuple]): Les origines possibles (x, y) avec leur rang
+                (de 1 à 5) dans la ligne ou la colonne.
+            directions (tuple): Les deux directions le long de la ligne ou de la
+                colonne, celle qui insère au début en premier.
+            avant (list[str]): Les cubes de la ligne ou colonne locale.
+            après (list[str]): Les cubes de la ligne ou colonne du serveur.
+
+        Returns:
+            tuple or None: Le coup (origine, direction) trouvé ou None.
+        """
+        for origine, rang in origines:
+            if avant[rang - 1] not in (" ", self.pion_adverse):
+                continue
+
+            reste = avant[:rang - 1] + avant[rang:]
+            candidats = ([self.pion_adverse] + reste, reste + [self.pion_adverse])
+
+            for direction, candidat in zip(directions, candidats):
+                if candidat == après and not self.réinsère_sur_la_même_bordure(
+                    origine, direction
+                ):
+                    return list(origine), direction
+
+        return None
+
+    @staticmethod
+    def réinsère_sur_la_même_bordure(origine, direction):
+        """Indique si le coup remet le cube sur la bordure d'où il a été retiré.
+
+        Ces coups sont interdits au Quixo.
+
+        Args:
+            origine (tuple): La position (x, y) du cube déplacé.
+            direction (str): La direction de l'insertion.
+
+        Returns:
+            bool: True si le coup est interdit pour cette raison.
+        """
+        x, y = origine
+        return (
+            (x == 1 and direction == "gauche")
+            or (x == 5 and direction == "droite")
+            or (y == 1 and direction == "haut")
+            or (y == 5 and direction == "bas")
+        )
@@ -3,8 +3,17 @@
 Ce module contient des tests unitaires pour le projet Quixo.
 """
 
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+from journal import JournalQuixo, reprendre_une_partie
 from plateau import Plateau
 from quixo import Quixo
+from session import SessionQuixo
 
 
 def test_formater_le_damier_pour_une_nouvelle_partie():
@@ -96,6 +105,318 @@ def test_formater_le_jeu_pour_une_partie_avancée():
     assert résultat == attendu, "Échec du test de formater le jeu pour une partie avancée"
 
 
+def test_insérer_un_cube_par_le_bas():
+    """Teste l'insertion d'un cube par le bas de la colonne."""
+    plateau = Plateau([
+        [" ", "X", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", "X", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+    ])
+
+    plateau.insérer_un_cube("X", (2, 2), "bas")
+
+    assert plateau.état_plateau() == [
+        [" ", "X", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", "X", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+        [" ", "X", " ", " ", " "],
+    ]
+
+
+def test_insérer_un_cube_par_le_haut():
+    """Teste l'insertion d'un cube par le haut de la colonne."""
+    plateau = Plateau([
+        [" ", "X", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", "X", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+    ])
+
+    plateau.insérer_un_cube("O", (2, 4), "haut")
+
+    assert plateau.état_plateau() == [
+        [" ", "O", " ", " ", " "],
+        [" ", "X", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", "O", " ", " ", " "],
+    ]
+
+
+def test_insérer_un_cube_par_la_gauche():
+    """Teste l'insertion d'un cube par la gauche de la ligne."""
+    plateau = Plateau([
+        [" ", " ", " ", " ", " "],
+        ["X", "O", " ", "X", "O"],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+    ])
+
+    plateau.insérer_un_cube("O", (4, 2), "gauche")
+
+    assert plateau.état_plateau() == [
+        [" ", " ", " ", " ", " "],
+        ["O", "X", "O", " ", "O"],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+    ]
+
+
+def test_insérer_un_cube_par_la_droite():
+    """Teste l'insertion d'un cube par la droite de la ligne."""
+    plateau = Plateau([
+        [" ", " ", " ", " ", " "],
+        ["X", "O", " ", "X", "O"],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+    ])
+
+    plateau.insérer_un_cube("X", (2, 2), "droite")
+
+    assert plateau.état_plateau() == [
+        [" ", " ", " ", " ", " "],
+        ["X", " ", "X", "O", "X"],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+    ]
+
+
+def test_synchroniser_la_session_avec_un_coup_adverse():
+    """Teste que la session retrouve le coup adverse sans reconstruire le plateau."""
+    session = SessionQuixo("1", ["josmi42", "automate"])
+    plateau_local = session.quixo.plateau
+
+    session.jouer_coup([1, 1], "bas")
+    serveur = plateau_local.copie()
+    serveur.insérer_un_cube("O", (5, 3), "gauche")
+
+    assert session.synchroniser(["josmi42", "automate"], serveur.état_plateau())
+    assert session.dernier_coup_adverse == ([5, 3], "gauche")
+    assert session.quixo.plateau is plateau_local
+    assert session.quixo.plateau.état_plateau() == serveur.état_plateau()
+
+
+def test_synchroniser_la_session_ignore_les_réinsertions_sur_la_même_bordure():
+    """Teste que la session ne retient pas un coup qui remet le cube sur sa bordure."""
+    session = SessionQuixo("1", ["josmi42", "automate"])
+
+    session.jouer_coup([5, 5], "haut")
+    serveur = session.quixo.plateau.copie()
+    serveur.insérer_un_cube("O", (2, 1), "gauche")
+
+    # (1, 1) "haut" donnerait le même plateau, mais ce coup est interdit.
+    assert session.synchroniser(["josmi42", "automate"], serveur.état_plateau())
+    assert session.dernier_coup_adverse == ([2, 1], "gauche")
+
+
+def test_synchroniser_la_session_avec_un_coup_adverse_en_colonne():
+    """Teste que la session retrouve un coup adverse qui déplace une colonne."""
+    session = SessionQuixo("1", ["josmi42", "automate"])
+
+    session.jouer_coup([1, 1], "bas")
+    serveur = session.quixo.plateau.copie()
+    serveur.insérer_un_cube("O", (3, 5), "haut")
+
+    assert session.synchroniser(["josmi42", "automate"], serveur.état_plateau())
+    assert session.dernier_coup_adverse == ([3, 5], "haut")
+    assert session.quixo.plateau.état_plateau() == serveur.état_plateau()
+
+
+def test_synchroniser_la_session_sans_coup_possible():
+    """Teste que la session reconstruit le plateau si aucun coup n'explique l'écart."""
+    session = SessionQuixo("1", ["josmi42", "automate"])
+    plateau = [
+        ["O", "O", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", "X"],
+    ]
+
+    assert not session.synchroniser(["josmi42", "automate"], plateau)
+    assert session.dernier_coup_adverse is None
+    assert session.quixo.plateau.état_plateau() == plateau
+
+
+def test_jouer_une_partie_avec_un_serveur_simulé():
+    """Teste un tour de la boucle de jeu avec des appels au serveur simulés."""
+    import main
+
+    joueurs = ["josmi42", "automate"]
+    session = SessionQuixo("1", joueurs)
+    session.quixo.choisir_un_coup = lambda: ([1, 1], "bas")
+    serveur = session.quixo.plateau.copie()
+    serveur.insérer_un_cube("X", (1, 1), "bas")
+    serveur.insérer_un_cube("O", (5, 3), "gauche")
+    réponses = [("1", joueurs, serveur.état_plateau()), "josmi42"]
+    coups = []
+
+    def jouer_un_coup(id_partie, origine, direction, idul, secret):
+        coups.append((id_partie, origine, direction, idul, secret))
+        return réponses.pop(0)
+
+    jouer_un_coup_original = main.jouer_un_coup
+    main.jouer_un_coup = jouer_un_coup
+    sortie = io.StringIO()
+
+    try:
+        with tempfile.TemporaryDirectory() as dossier:
+            with JournalQuixo(os.path.join(dossier, "journal.sqlite3")) as journal:
+                journal.ouvrir_partie("1", joueurs)
+                with contextlib.redirect_stdout(sortie):
+                    gagnant = main.jouer_une_partie(session, journal, "josmi42")
+                assert journal.parties_ouvertes() == []
+                tour = journal.connexion.execute(
+                    "SELECT pion, origine, direction FROM coups ORDER BY numéro"
+                ).fetchall()
+                assert tour == [("X", "[1, 1]", "bas"), ("O", "[5, 3]", "gauche")]
+    finally:
+        main.jouer_un_coup = jouer_un_coup_original
+
+    assert gagnant == "josmi42"
+    assert len(coups) == 2
+    assert session.dernier_coup_adverse == ([5, 3], "gauche")
+    assert session.quixo.plateau.état_plateau() == serveur.état_plateau()
+    assert "Le gagnant est josmi42" in sortie.getvalue()
+
+
+def test_reprendre_une_partie_depuis_le_journal():
+    """Teste que le journal retrouve les parties ouvertes et leur dernier plateau."""
+    joueurs = ["josmi42", "automate"]
+    plateau = Plateau()
+    plateau.insérer_un_cube("X", (1, 1), "bas")
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "journal.sqlite3")
+
+        with JournalQuixo(chemin) as journal:
+            journal.ouvrir_partie("1", joueurs)
+            journal.ouvrir_partie("2", joueurs)
+            journal.enregistrer_coup("1", "X", [1, 1], "bas", plateau.état_plateau())
+            journal.terminer_partie("2", "josmi42")
+
+        with JournalQuixo(chemin) as journal:
+            assert journal.parties_ouvertes() == [("1", joueurs, plateau.état_plateau())]
+
+
+def test_journal_conserve_les_coups_après_un_arrêt_brutal():
+    """Teste que les coups enregistrés survivent à un arrêt sans fermer le journal."""
+    script = (
+        "import os, sys\n"
+        "from journal import JournalQuixo\n"
+        "from plateau import Plateau\n"
+        "journal = JournalQuixo(sys.argv[1])\n"
+        "journal.ouvrir_partie('1', ['josmi42', 'automate'])\n"
+        "plateau = Plateau()\n"
+        "for x in range(1, 6):\n"
+        "    plateau.insérer_un_cube('X', (x, 1), 'bas')\n"
+        "    journal.enregistrer_coup('1', 'X', [x, 1], 'bas', plateau.état_plateau())\n"
+        "os._exit(1)\n"
+    )
+    attendu = [[" "] * 5 for _ in range(4)] + [["X"] * 5]
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "journal.sqlite3")
+        subprocess.run(
+            [sys.executable, "-c", script, chemin],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            check=False,
+        )
+
+        with JournalQuixo(chemin) as journal:
+            nombre = journal.connexion.execute("SELECT COUNT(*) FROM coups").fetchone()[0]
+            assert nombre == 5
+            assert journal.parties_ouvertes() == [
+                ("1", ["josmi42", "automate"], attendu)
+            ]
+
+
+def test_reprendre_une_partie_avec_le_serveur():
+    """Teste la reprise d'une partie confirmée par un serveur simulé."""
+    joueurs = ["josmi42", "automate"]
+    plateau_journal = Plateau()
+    plateau_journal.insérer_un_cube("X", (1, 1), "bas")
+    plateau_un_coup = plateau_journal.copie()
+    plateau_un_coup.insérer_un_cube("O", (5, 3), "gauche")
+    plateau_plusieurs_coups = [
+        ["O", "O", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", " "],
+        [" ", " ", " ", " ", "X"],
+    ]
+    serveur = {
+        "1": ("1", joueurs, plateau_journal.état_plateau(), "automate"),
+        "2": ("2", joueurs, plateau_un_coup.état_plateau(), None),
+        "3": ("3", joueurs, plateau_plusieurs_coups, None),
+    }
+
+    def récupérer(id_partie):
+        return serveur[id_partie]
+
+    def récupérer_sans_connexion(id_partie):
+        raise ConnectionError(f"Partie {id_partie} injoignable")
+
+    with tempfile.TemporaryDirectory() as dossier:
+        with JournalQuixo(os.path.join(dossier, "journal.sqlite3")) as journal:
+            for id_partie in ["3", "2", "1"]:
+                journal.ouvrir_partie(id_partie, joueurs)
+            journal.enregistrer_coup("2", "X", [1, 1], "bas", plateau_journal.état_plateau())
+
+            assert reprendre_une_partie(journal, récupérer_sans_connexion) is None
+
+            # La partie 1 est terminée; la partie 2 reprend depuis le journal.
+            session = reprendre_une_partie(journal, récupérer)
+            assert [partie[0] for partie in journal.parties_ouvertes()] == ["2", "3"]
+            assert session.id_partie == "2"
+            assert session.dernier_coup_adverse == ([5, 3], "gauche")
+            assert session.quixo.plateau.état_plateau() == plateau_un_coup.état_plateau()
+
+            # La partie 3 diffère de plusieurs coups et doit être reconstruite.
+            journal.terminer_partie("2", "josmi42")
+            session = reprendre_une_partie(journal, récupérer)
+            assert session.id_partie == "3"
+            assert session.dernier_coup_adverse is None
+            assert session.quixo.plateau.état_plateau() == plateau_plusieurs_coups
+
+
+def test_reprendre_une_partie_malgré_des_parties_invalides():
+    """Teste que la reprise passe aux parties suivantes quand une partie échoue."""
+    joueurs = ["josmi42", "automate"]
+    plateau = Plateau().état_plateau()
+
+    def récupérer(id_partie):
+        if id_partie == "expirée":
+            raise RuntimeError("La partie expirée est introuvable.")
+        if id_partie == "invalide":
+            raise KeyError("état")
+        if id_partie == "refusée":
+            raise PermissionError("Accès refusé")
+        return id_partie, joueurs, plateau, None
+
+    with tempfile.TemporaryDirectory() as dossier:
+        with JournalQuixo(os.path.join(dossier, "journal.sqlite3")) as journal:
+            for id_partie in ["valide", "refusée", "invalide", "expirée"]:
+                journal.ouvrir_partie(id_partie, joueurs)
+
+            session = reprendre_une_partie(journal, récupérer)
+
+            assert session.id_partie == "valide"
+            assert [partie[0] for partie in journal.parties_ouvertes()] == [
+                "invalide",
+                "refusée",
+                "valide",
+            ]
+
+
 if __name__ == "__main__":
     test_formater_le_damier_pour_une_nouvelle_partie()
     print("Test de formater le damier pour une nouvelle partie réussi")
@@ -103,3 +424,29 @@ if __name__ == "__main__":
     print("Test de formater le jeu pour une nouvelle partie réussi")
     test_formater_le_jeu_pour_une_partie_avancée()
     print("Test de formater le jeu pour une partie avancée réussi")
+    test_insérer_un_cube_par_le_bas()
+    print("Test d'insérer un cube par le bas réussi")
+    test_insérer_un_cube_par_le_haut()
+    print("Test d'insérer un cube par le haut réussi")
+    test_insérer_un_cube_par_la_gauche()
+    print("Test d'insérer un cube par la gauche réussi")
+    test_insérer_un_cube_par_la_droite()
+    print("Test d'insérer un cube par la droite réussi")
+    test_synchroniser_la_session_avec_un_coup_adverse()
+    print("Test de synchroniser la session avec un coup adverse réussi")
+    test_synchroniser_la_session_ignore_les_réinsertions_sur_la_même_bordure()
+    print("Test de synchroniser la session sans réinsertion sur la même bordure réussi")
+    test_synchroniser_la_session_avec_un_coup_adverse_en_colonne()
+    print("Test de synchroniser la session avec un coup adverse en colonne réussi")
+    test_synchroniser_la_session_sans_coup_possible()
+    print("Test de synchroniser la session sans coup possible réussi")
+    test_jouer_une_partie_avec_un_serveur_simulé()
+    print("Test de jouer une partie avec un serveur simulé réussi")
+    test_reprendre_une_partie_depuis_le_journal()
+    print("Test de reprendre une partie depuis le journal réussi")
+    test_journal_conserve_les_coups_après_un_arrêt_brutal()
+    print("Test de conserver les coups après un arrêt brutal réussi")
+    test_reprendre_une_partie_avec_le_serveur()
+    print("Test de reprendre une partie avec le serveur réussi")
+    test_reprendre_une_partie_malgré_des_parties_invalides()
+    print("Test de reprendre une partie malgré des parties invalides réussi")